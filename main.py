@@ -12,17 +12,61 @@ import os
 import re
 import time
 import signal
+import atexit
+import selectors
+import threading
+import queue
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import shutil
 import random
 import colorsys
+import bisect
+import functools
+import hashlib
+import json
 from pathlib import Path
 
+try:
+    import dbus
+except ImportError:  # fall back to spawning playerctl
+    dbus = None
+
+try:
+    import dbus.mainloop.glib
+    from gi.repository import GLib
+except ImportError:  # no signal support; keep polling
+    GLib = None
+
 # Configuration
 PLAYERS = ["firefox", "edge", "chromium", "chrome"]
 SCALED_LYRICS_DIR = Path.home() / ".cache" / "sptlrx-scaled"
 LOG_FILE = Path.home() / ".cache" / "sptlrx-scaled" / "debug.log"
+DEBUG_LOG = True  # set to False to skip writing debug.log entirely
+API_CACHE_DIR = SCALED_LYRICS_DIR / "api"
+API_CACHE_TTL = 24 * 60 * 60          # seconds to keep found lyrics
+API_CACHE_NEGATIVE_TTL = 60 * 60      # seconds to remember "no lyrics found"
+API_MEMO_SIZE = 128                   # lookups also kept in memory (same TTLs apply)
+API_CACHE_MAX_FILES = 500             # newest lookups kept on disk, older ones are deleted at startup
+NEGATIVE_CACHE_FILE = SCALED_LYRICS_DIR / "negative.json"
+NEGATIVE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds to skip songs that had no lyrics
 KEY_COLOR_FILE = "/tmp/cava-key-color"
+TITLE_CHECK_INTERVAL = 5  # seconds between backstop title checks when using DBus signals
+
+# MPRIS over DBus
+MPRIS_PREFIX = "org.mpris.MediaPlayer2."
+MPRIS_PATH = "/org/mpris/MediaPlayer2"
+MPRIS_PLAYER_IFACE = "org.mpris.MediaPlayer2.Player"
+
+# Shared HTTP session so lrclib.net lookups reuse one keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "sptlrx-scaled/1.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
 
 
 # ── theme helpers ─────────────────────────────────────────────────────────────
@@ -60,11 +104,20 @@ NO_LYRICS_PHRASES = [
     "Enjoy the music...",
 ]
 
+_log_fh = None                # line-buffered debug log handle, opened on first use
+_log_lock = threading.Lock()  # log() is also called from lyrics search threads
+
 def log(msg):
     """Write message to log file."""
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(LOG_FILE, "a") as f:
-        f.write(f"{time.strftime('%H:%M:%S')} {msg}\n")
+    global _log_fh
+    if not DEBUG_LOG:
+        return
+    with _log_lock:
+        if _log_fh is None:
+            LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _log_fh = open(LOG_FILE, "a", buffering=1)
+            atexit.register(_log_fh.close)
+        _log_fh.write(f"{time.strftime('%H:%M:%S')} {msg}\n")
 
 # Patterns to detect slowed songs
 SLOWED_PATTERNS = [
@@ -81,9 +134,58 @@ SLOWED_PATTERNS = [
     r'pitched\s*down',                             # pitched down
 ]
 
+# Precompiled regexes (compiled once at import instead of on every call)
+_SLOWED_RE = re.compile('|'.join(f'(?:{p})' for p in SLOWED_PATTERNS), re.IGNORECASE)
+_TS_SUB_RE = re.compile(r'^\[(\d+):(\d+)\.(\d+)\]', re.MULTILINE)  # line-leading timestamps
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Fullwidth → ASCII translation table used by parse_title
+_FULLWIDTH_TO_ASCII = str.maketrans(
+    'ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ０１２３４５６７８９　',
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
+)
+
+# (pattern, replacement) pairs applied in order by parse_title.
+# Each step is an alternation so the title is scanned as few times as
+# possible; steps stay separate where an earlier removal can create a
+# match for a later one (e.g. "~ (x) slowed" only becomes "~ slowed"
+# once the brackets are gone).
+_TITLE_CLEANUP = [
+    # Remove the YouTube Music suffix and EVERYTHING in (...), [...], {...},
+    # 「...」 and 『...』
+    (re.compile(
+        r'\s*-\s*YouTube Music$'
+        r'|\s*(?:\([^)]*\)|\[[^\]]*\]|\{[^}]*\}|「[^」]*」|『[^』]*』)'), ''),
+    # Remove slowed patterns that aren't in brackets, from the first hit to the end:
+    # "~ Slowed...", "- Slowed...", "Slowed and Reverb", "Super Slowed + Reverb",
+    # "Slowed Version", "sped down" and "pitched down".
+    # Also remove non-ASCII characters that are likely junk (like 中ジ芋),
+    # but keep common punctuation and accented letters. Only the slowed
+    # branches ignore case: under case folding the junk class would let
+    # characters like K (Kelvin sign) through.
+    (re.compile(
+        r'\s*(?i:~\s*(?:super\s*)?slowed'
+        r'|-\s*(?:super\s*)?slowed'
+        r'|(?:super\s*)?slowed\s*(?:and|\+|&)?\s*reverb'
+        r'|(?:super\s*)?slowed\s*version'
+        r'|(?:sped|pitched)\s*down).*$'
+        r'|[^\x00-\x7F\u00C0-\u024F]+'), ''),
+    # Clean up trailing separators and spaces
+    (re.compile(r'\s*[~\-|／/]\s*$'), ''),
+    (_WHITESPACE_RE, ' '),
+]
+
 # Global for cleanup
 original_config_backed_up = False
 fallback_mode = False  # True when showing music icon instead of lyrics
+_session_bus = None    # dbus.SessionBus, connected on first use
+_player_props = None   # Properties proxy of the active MPRIS player
+_player_watch_active = False        # True once PropertiesChanged signals are subscribed
+_player_changed = threading.Event() # Set by the signal handler on track/playback changes
+_term_size = shutil.get_terminal_size((80, 24))  # refreshed on SIGWINCH
+_lyrics_memo = {}      # (song, artist, expected_duration) -> cached lookup, oldest first
+_lyrics_memo_lock = threading.Lock()  # _lyrics_memo is shared by the lyrics search threads
 
 def cleanup(signum=None, frame=None):
     """Cleanup on exit."""
@@ -92,8 +194,14 @@ def cleanup(signum=None, frame=None):
     sys.stdout.flush()
     sys.exit(0)
 
+def on_resize(signum=None, frame=None):
+    """Refresh the cached terminal size (SIGWINCH)."""
+    global _term_size
+    _term_size = shutil.get_terminal_size((80, 24))
+
 signal.signal(signal.SIGINT, cleanup)
 signal.signal(signal.SIGTERM, cleanup)
+signal.signal(signal.SIGWINCH, on_resize)
 
 def run_playerctl(*args):
     """Run playerctl command and return output."""
@@ -103,8 +211,122 @@ def run_playerctl(*args):
     except subprocess.CalledProcessError:
         return None
 
+def follow_title():
+    """
+    Start `playerctl --follow` so title changes are pushed to us.
+    Prints one line per change (empty when the player goes away).
+    """
+    cmd = ["playerctl", f"--player={','.join(PLAYERS)}", "--follow",
+           "metadata", "--format", "{{xesam:title}}"]
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+def get_player_props():
+    """
+    Find the first running MPRIS player matching PLAYERS (same preference
+    order as playerctl) and return its cached Properties proxy.
+    """
+    global _session_bus, _player_props
+    if _player_props is not None:
+        return _player_props
+    if _session_bus is None:
+        _session_bus = dbus.SessionBus()
+    
+    names = [n for n in _session_bus.list_names() if n.startswith(MPRIS_PREFIX)]
+    for player in PLAYERS:
+        for name in names:
+            instance = name[len(MPRIS_PREFIX):]
+            if instance == player or instance.startswith(player + "."):
+                obj = _session_bus.get_object(name, MPRIS_PATH)
+                _player_props = dbus.Interface(obj, "org.freedesktop.DBus.Properties")
+                return _player_props
+    return None
+
+def get_player_state():
+    """Fetch all MPRIS player properties in a single DBus call."""
+    global _player_props
+    try:
+        props = get_player_props()
+        if props is None:
+            return None
+        return props.GetAll(MPRIS_PLAYER_IFACE)
+    except dbus.exceptions.DBusException:
+        _player_props = None  # player went away; rediscover on next call
+        return None
+
+def on_props_changed(interface, changed, invalidated):
+    """PropertiesChanged handler: wake the main thread on track/playback changes."""
+    if interface == MPRIS_PLAYER_IFACE and ("Metadata" in changed or "PlaybackStatus" in changed):
+        _player_changed.set()
+
+def start_player_watch():
+    """
+    Subscribe to MPRIS PropertiesChanged signals, dispatched by a GLib main
+    loop on a background thread. Returns True if signals are available.
+    """
+    global _session_bus
+    if dbus is None or GLib is None:
+        return False
+    try:
+        dbus.mainloop.glib.threads_init()
+        dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+        _session_bus = dbus.SessionBus()
+        _session_bus.add_signal_receiver(
+            on_props_changed,
+            signal_name="PropertiesChanged",
+            dbus_interface="org.freedesktop.DBus.Properties",
+            path=MPRIS_PATH,
+        )
+    except dbus.exceptions.DBusException as e:
+        log(f"⚠️  DBus signals unavailable, polling instead: {e}")
+        return False
+    threading.Thread(target=GLib.MainLoop().run, daemon=True).start()
+    return True
+
+def wait_for_player_change(timeout):
+    """
+    Sleep up to `timeout` seconds, returning True early if the player
+    signalled a change. Without signal support this is a plain sleep.
+    """
+    # Only clear after a wakeup: clearing on timeout could drop a signal
+    # that arrived between wait() returning and the clear()
+    if _player_changed.wait(timeout):
+        _player_changed.clear()
+        return True
+    return False
+
+def player_poll_interval():
+    """How long idle loops may wait between player checks."""
+    return 1.0 if _player_watch_active else 0.1
+
 def get_metadata():
     """Get current song metadata."""
+    if dbus is None:
+        return get_metadata_playerctl()
+    
+    state = get_player_state()
+    if not state:
+        return None
+    
+    meta = state.get("Metadata", {})
+    title = str(meta.get("xesam:title", "")).strip()
+    artist = meta.get("xesam:artist", [])
+    if not isinstance(artist, str):
+        artist = ", ".join(str(a) for a in artist)
+    artist = artist.strip()
+    length = meta.get("mpris:length")
+    
+    if not title:
+        return None
+    
+    return {
+        "title": title,
+        "artist": artist,
+        "length_us": int(length) if length else None,
+        "length_sec": int(length) / 1_000_000 if length else None
+    }
+
+def get_metadata_playerctl():
+    """Get current song metadata by spawning playerctl."""
     title = run_playerctl("metadata", "xesam:title")
     artist = run_playerctl("metadata", "xesam:artist") 
     length = run_playerctl("metadata", "mpris:length")
@@ -121,12 +343,9 @@ def get_metadata():
 
 def is_slowed_song(title):
     """Check if the song title indicates it's a slowed version."""
-    title_lower = title.lower()
-    for pattern in SLOWED_PATTERNS:
-        if re.search(pattern, title_lower):
-            return True
-    return False
+    return _SLOWED_RE.search(title) is not None
 
+@functools.lru_cache(maxsize=64)
 def parse_title(raw_title):
     """
     Parse YouTube Music title to extract artist and song name.
@@ -135,42 +354,11 @@ def parse_title(raw_title):
     We don't know which, so caller should try both.
     """
     # Convert fullwidth characters to ASCII (ｓｌｏｗｅｄ → slowed)
-    title = raw_title
-    fullwidth_to_ascii = str.maketrans(
-        'ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ０１２３４５６７８９　',
-        'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
-    )
-    title = title.translate(fullwidth_to_ascii)
-    
-    # Remove YouTube Music suffix FIRST
-    title = re.sub(r'\s*-\s*YouTube Music$', '', title)
-    
-    # Remove EVERYTHING in parentheses and brackets (catches all variations)
-    title = re.sub(r'\s*\([^)]*\)', '', title)  # Remove (...)
-    title = re.sub(r'\s*\[[^\]]*\]', '', title)  # Remove [...]
-    title = re.sub(r'\s*\{[^}]*\}', '', title)   # Remove {...}
-    title = re.sub(r'\s*「[^」]*」', '', title)  # Remove Japanese quotes 「...」
-    title = re.sub(r'\s*『[^』]*』', '', title)  # Remove Japanese quotes 『...』
-    
-    # Remove slowed patterns that aren't in brackets
-    # Handle "~ Slowed..." format (common on YT)
-    title = re.sub(r'\s*~\s*(super\s*)?slowed.*$', '', title, flags=re.IGNORECASE)
-    # Handle "- Slowed..." at end
-    title = re.sub(r'\s*-\s*(super\s*)?slowed.*$', '', title, flags=re.IGNORECASE)
-    # Handle standalone "Slowed and Reverb" or "Super Slowed + Reverb"
-    title = re.sub(r'\s*(super\s*)?slowed\s*(and|\+|&)?\s*reverb.*$', '', title, flags=re.IGNORECASE)
-    # Handle "Slowed Version"
-    title = re.sub(r'\s*(super\s*)?slowed\s*version.*$', '', title, flags=re.IGNORECASE)
-    # Handle "sped down" and "pitched down"
-    title = re.sub(r'\s*(sped|pitched)\s*down.*$', '', title, flags=re.IGNORECASE)
-    
-    # Remove non-ASCII characters that are likely junk (like 中ジ芋)
-    # But keep common punctuation and accented letters
-    title = re.sub(r'[^\x00-\x7F\u00C0-\u024F]+', '', title)
+    title = raw_title.translate(_FULLWIDTH_TO_ASCII)
     
-    # Clean up trailing separators and spaces
-    title = re.sub(r'\s*[~\-|／/]\s*$', '', title)
-    title = re.sub(r'\s+', ' ', title).strip()
+    for pattern, repl in _TITLE_CLEANUP:
+        title = pattern.sub(repl, title)
+    title = title.strip()
     
     # Try to split into two parts using various separators
     # Common separators: " - ", "- ", " -", " ~ ", " | ", " － " (fullwidth)
@@ -188,10 +376,11 @@ def parse_title(raw_title):
     
     return part1, part2
 
-def fetch_lyrics_lrclib(song, artist=None, expected_duration=None):
+def query_lrclib(song, artist=None, expected_duration=None):
     """
     Fetch synced lyrics from lrclib.net API.
     Optimized for speed - minimal API calls.
+    Returns None when nothing matches; raises on network/API errors.
     """
     
     song_lower = song.lower().strip()
@@ -200,55 +389,54 @@ def fetch_lyrics_lrclib(song, artist=None, expected_duration=None):
     # Strategy 1: If we have artist, try exact match first (fastest)
     if artist:
         try:
-            resp = requests.get("https://lrclib.net/api/search", 
+            resp = _SESSION.get("https://lrclib.net/api/search", 
                               params={"track_name": song, "artist_name": artist}, 
                               timeout=10)
-            if resp.status_code == 200:
-                results = resp.json()
-                for r in results:
-                    if r.get("syncedLyrics"):
-                        track = r.get("trackName", "").lower().strip()
-                        result_artist = r.get("artistName", "").lower().strip()
-                        # Check track matches (exact or without spaces)
-                        track_matches = (track == song_lower or 
-                                        track.replace(" ", "") == song_lower.replace(" ", ""))
-                        # Check artist matches (exact, without spaces, or contained within)
-                        artist_matches = (result_artist == artist_lower or
-                                         result_artist.replace(" ", "") == artist_lower.replace(" ", "") or
-                                         artist_lower in result_artist or
-                                         result_artist in artist_lower)
-                        if track_matches and artist_matches:
-                            log(f"  ✓ Found lyrics by '{r.get('artistName')}'")
-                            return {
-                                "lyrics": r["syncedLyrics"],
-                                "duration": r.get("duration"),
-                                "title": r.get("trackName"),
-                                "artist": r.get("artistName")
-                            }
-                # If we got results but none matched our criteria, log it
-                if results:
-                    log(f"  ⚠️ API returned {len(results)} results but none matched exactly")
+            resp.raise_for_status()
+            results = resp.json()
         except requests.exceptions.Timeout:
             log(f"  ⚠️ API timeout for '{song}' by '{artist}'")
+            raise
         except Exception as e:
             log(f"  ⚠️ API error: {type(e).__name__}: {e}")
+            raise
+        for r in results:
+            if r.get("syncedLyrics"):
+                track = r.get("trackName", "").lower().strip()
+                result_artist = r.get("artistName", "").lower().strip()
+                # Check track matches (exact or without spaces)
+                track_matches = (track == song_lower or 
+                                track.replace(" ", "") == song_lower.replace(" ", ""))
+                # Check artist matches (exact, without spaces, or contained within)
+                artist_matches = (result_artist == artist_lower or
+                                 result_artist.replace(" ", "") == artist_lower.replace(" ", "") or
+                                 artist_lower in result_artist or
+                                 result_artist in artist_lower)
+                if track_matches and artist_matches:
+                    log(f"  ✓ Found lyrics by '{r.get('artistName')}'")
+                    return {
+                        "lyrics": r["syncedLyrics"],
+                        "duration": r.get("duration"),
+                        "title": r.get("trackName"),
+                        "artist": r.get("artistName")
+                    }
+        # If we got results but none matched our criteria, log it
+        if results:
+            log(f"  ⚠️ API returned {len(results)} results but none matched exactly")
         # If artist was provided but no match found, return None
         # Let the caller try a different song/artist combination
         return None
     
     # Strategy 2: Generic search by track name only (when no artist provided)
     try:
-        resp = requests.get("https://lrclib.net/api/search", 
+        resp = _SESSION.get("https://lrclib.net/api/search", 
                           params={"track_name": song}, 
                           timeout=5)
-        if resp.status_code != 200:
-            log(f"  ❌ API error")
-            return None
-            
+        resp.raise_for_status()
         results = resp.json()
     except Exception as e:
-        log(f"  ❌ Network error")
-        return None
+        log(f"  ❌ API error: {type(e).__name__}: {e}")
+        raise
     
     # Filter for exact title matches with synced lyrics
     candidates = []
@@ -314,21 +502,157 @@ def fetch_lyrics_lrclib(song, artist=None, expected_duration=None):
         "artist": best.get("artistName")
     }
 
-def parse_lrc_timestamp(timestamp):
-    """Parse [mm:ss.xx] to milliseconds."""
-    match = re.match(r'\[(\d+):(\d+)\.(\d+)\]', timestamp)
-    if match:
-        mins = int(match.group(1))
-        secs = int(match.group(2))
-        ms_str = match.group(3)
-        if len(ms_str) == 2:
-            ms = int(ms_str) * 10
-        elif len(ms_str) == 3:
-            ms = int(ms_str)
-        else:
-            ms = int(ms_str[:3])
-        return mins * 60 * 1000 + secs * 1000 + ms
-    return None
+def get_api_cache_path(song, artist, expected_duration):
+    """Cache file for a lyrics lookup, keyed by its search parameters."""
+    key = f"{song}|{artist or ''}|{expected_duration or ''}"
+    return API_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+def is_cache_entry_fresh(entry):
+    """True if a cached lookup ({"fetched_at", "result"}) is still within its TTL."""
+    try:
+        ttl = API_CACHE_TTL if entry["result"] else API_CACHE_NEGATIVE_TTL
+        return time.time() - entry["fetched_at"] < ttl
+    except (KeyError, TypeError):
+        return False
+
+def fetch_lyrics_cached(song, artist, expected_duration):
+    """
+    Look up lyrics in memory, then in the on-disk cache, before hitting
+    lrclib.net. Misses are cached too, but expire sooner than hits.
+    Network errors propagate (and are not cached) so the caller can tell
+    them apart.
+    """
+    key = (song, artist, expected_duration)
+    with _lyrics_memo_lock:
+        entry = _lyrics_memo.get(key)
+    if entry is None:
+        try:
+            entry = json.loads(get_api_cache_path(song, artist, expected_duration).read_text())
+        except (OSError, ValueError):
+            entry = None
+    if entry is not None and is_cache_entry_fresh(entry):
+        remember_lookup(key, entry)
+        return entry["result"]
+
+    result = query_lrclib(song, artist, expected_duration)
+    entry = {"fetched_at": time.time(), "result": result}
+    remember_lookup(key, entry)
+
+    try:
+        API_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        get_api_cache_path(song, artist, expected_duration).write_text(json.dumps(entry))
+    except OSError as e:
+        log(f"  ⚠️ Could not write API cache: {e}")
+    return result
+
+def remember_lookup(key, entry):
+    """Keep a lookup in the in-memory cache, evicting the oldest beyond API_MEMO_SIZE."""
+    with _lyrics_memo_lock:
+        _lyrics_memo.pop(key, None)
+        _lyrics_memo[key] = entry
+        if len(_lyrics_memo) > API_MEMO_SIZE:
+            _lyrics_memo.pop(next(iter(_lyrics_memo)))
+
+def lookup_in_background(song, artist, expected_duration, slots, cancelled):
+    """
+    Run fetch_lyrics_cached on a daemon thread, so quitting never waits
+    on a slow request. At most `slots` lookups run at once, and lookups
+    still waiting for a slot are skipped once `cancelled` is set.
+    Returns a queue that receives (ok, result) when the lookup finishes.
+    """
+    outcome = queue.SimpleQueue()
+
+    def worker():
+        with slots:
+            if cancelled.is_set():
+                return
+            try:
+                outcome.put((True, fetch_lyrics_cached(song, artist, expected_duration)))
+            except Exception:
+                outcome.put((False, None))
+
+    threading.Thread(target=worker, daemon=True).start()
+    return outcome
+
+def prune_api_cache():
+    """Delete expired or unreadable API cache files, then all but the newest API_CACHE_MAX_FILES."""
+    stale = []
+    kept = []
+    for path in API_CACHE_DIR.glob("*.json"):
+        try:
+            if is_cache_entry_fresh(json.loads(path.read_text())):
+                kept.append((path.stat().st_mtime, path))
+                continue
+        except (OSError, ValueError):
+            pass
+        stale.append(path)
+    kept.sort(reverse=True)
+    stale.extend(path for _, path in kept[API_CACHE_MAX_FILES:])
+    for path in stale:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    if stale:
+        log(f"Pruned {len(stale)} API cache file(s)")
+
+def load_negative_cache():
+    """Load {raw_title: timestamp} of songs whose lyrics search came up empty."""
+    try:
+        entries = json.loads(NEGATIVE_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    # Ignore malformed entries rather than crash on them later
+    return {title: ts for title, ts in entries.items()
+            if isinstance(ts, (int, float)) and not isinstance(ts, bool)}
+
+def save_negative_cache(entries):
+    """Persist the negative cache."""
+    try:
+        NEGATIVE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        NEGATIVE_CACHE_FILE.write_text(json.dumps(entries))
+    except OSError as e:
+        log(f"⚠️  Could not write negative cache: {e}")
+
+def prune_negative_cache():
+    """Drop negative cache entries older than NEGATIVE_CACHE_TTL."""
+    entries = load_negative_cache()
+    now = time.time()
+    fresh = {title: ts for title, ts in entries.items() if now - ts < NEGATIVE_CACHE_TTL}
+    if len(fresh) != len(entries):
+        save_negative_cache(fresh)
+
+def lrc_time_to_ms(mins_str, secs_str, frac_str):
+    """Convert the digit groups of an [mm:ss.xx] tag to milliseconds."""
+    if len(frac_str) == 2:
+        ms = int(frac_str) * 10
+    elif len(frac_str) == 3:
+        ms = int(frac_str)
+    else:
+        ms = int(frac_str[:3])
+    return int(mins_str) * 60 * 1000 + int(secs_str) * 1000 + ms
+
+def _parse_lrc_tag(line):
+    """
+    Parse a leading [mm:ss.xx] tag without the regex engine.
+    Returns (milliseconds, index of the closing bracket) or None.
+    """
+    if not line.startswith('['):
+        return None
+    try:
+        colon = line.index(':', 1)
+        dot = line.index('.', colon)
+        close = line.index(']', dot)
+    except ValueError:
+        return None
+    mins_str = line[1:colon]
+    secs_str = line[colon + 1:dot]
+    ms_str = line[dot + 1:close]
+    if not (mins_str.isdecimal() and secs_str.isdecimal() and ms_str.isdecimal()):
+        return None
+    return lrc_time_to_ms(mins_str, secs_str, ms_str), close
 
 def format_lrc_timestamp(ms):
     """Format milliseconds to [mm:ss.xx]."""
@@ -337,32 +661,20 @@ def format_lrc_timestamp(ms):
     secs = total_secs % 60
     return f"[{mins:02d}:{secs:05.2f}]"
 
+def _scaled_ts(match, scale_factor):
+    """re.sub callback: scale one [mm:ss.xx] timestamp match."""
+    total_ms = lrc_time_to_ms(*match.group(1, 2, 3))
+    return format_lrc_timestamp(int(total_ms * scale_factor))
+
 def scale_lyrics(lyrics_text, scale_factor):
     """Scale all timestamps in lyrics by the given factor."""
-    lines = lyrics_text.split('\n')
-    scaled_lines = []
-    
-    for line in lines:
-        match = re.match(r'(\[\d+:\d+\.\d+\])(.*)', line)
-        if match:
-            timestamp = match.group(1)
-            text = match.group(2)
-            ms = parse_lrc_timestamp(timestamp)
-            if ms is not None:
-                scaled_ms = int(ms * scale_factor)
-                new_timestamp = format_lrc_timestamp(scaled_ms)
-                scaled_lines.append(f"{new_timestamp}{text}")
-            else:
-                scaled_lines.append(line)
-        else:
-            scaled_lines.append(line)
-    
-    return '\n'.join(scaled_lines)
+    return _TS_SUB_RE.sub(lambda m: _scaled_ts(m, scale_factor), lyrics_text)
 
+@functools.lru_cache(maxsize=64)
 def get_safe_filename(title):
     """Create a safe filename from title."""
-    safe_name = re.sub(r'[^\w\s-]', '', title)
-    safe_name = re.sub(r'\s+', ' ', safe_name).strip()
+    safe_name = _UNSAFE_CHARS_RE.sub('', title)
+    safe_name = _WHITESPACE_RE.sub(' ', safe_name).strip()
     return safe_name[:100]  # Limit length
 
 def save_scaled_lyrics(lyrics_text, raw_title):
@@ -383,25 +695,21 @@ def show_music_icon(message=""):
     """
     Display a centered music icon as fallback when lyrics aren't available.
     """
-    import shutil as sh
-    
     music_icon = "♫"
-    cols, rows = sh.get_terminal_size((80, 24))
-    
-    # Clear and position
-    sys.stdout.write("\033[2J\033[H\033[?25l")
+    cols, rows = _term_size
     
     center_row = rows // 2
     center_col = (cols - len(music_icon)) // 2
     
-    sys.stdout.write(f"\033[{center_row};{center_col}H")
-    sys.stdout.write(f"\033[1;37m{music_icon}\033[0m")
+    # Clear and position, built up and written in one go
+    out = ["\033[2J\033[H\033[?25l",
+           f"\033[{center_row};{center_col}H\033[1;37m{music_icon}\033[0m"]
     
     if message:
         msg_col = (cols - len(message)) // 2
-        sys.stdout.write(f"\033[{center_row + 2};{msg_col}H")
-        sys.stdout.write(f"\033[90m{message}\033[0m")
+        out.append(f"\033[{center_row + 2};{msg_col}H\033[90m{message}\033[0m")
     
+    sys.stdout.write("".join(out))
     sys.stdout.flush()
 
 def run_cmatrix_fallback(current_title):
@@ -426,7 +734,7 @@ def run_cmatrix_fallback(current_title):
                 last_color_check = time.time()
                 r, g, b = get_theme_rgb()
                 set_terminal_color(r, g, b)
-            time.sleep(0.1)
+            wait_for_player_change(player_poll_interval())
     finally:
         proc.terminate()
         try:
@@ -441,12 +749,10 @@ def show_nms_animation(message=None):
     """
     Display a random 'no lyrics' message using nms (No More Secrets) effect.
     """
-    import shutil as sh
-    
     if not message:
         message = random.choice(NO_LYRICS_PHRASES)
         
-    cols, rows = sh.get_terminal_size((80, 24))
+    cols, rows = _term_size
     
     # Clear screen
     sys.stdout.write("\033[2J\033[H\033[?25l")
@@ -473,6 +779,16 @@ def show_nms_animation(message=None):
 
 def get_position():
     """Get current playback position in milliseconds."""
+    if dbus is None:
+        return get_position_playerctl()
+    
+    state = get_player_state()
+    if not state or state.get("PlaybackStatus") != "Playing" or "Position" not in state:
+        return None
+    return int(state["Position"]) // 1000  # Convert us to ms
+
+def get_position_playerctl():
+    """Get current playback position in milliseconds by spawning playerctl."""
     try:
         # First find which player is actually playing
         cmd = ["playerctl", f"--player={','.join(PLAYERS)}", "status"]
@@ -489,42 +805,41 @@ def get_position():
         return None
 
 def parse_lyrics_file(filepath):
-    """Parse LRC file into list of (timestamp_ms, text) tuples."""
-    lines = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            match = re.match(r'\[(\d+):(\d+)\.(\d+)\](.*)', line)
-            if match:
-                mins = int(match.group(1))
-                secs = int(match.group(2))
-                ms_str = match.group(3)
-                if len(ms_str) == 2:
-                    ms = int(ms_str) * 10
-                elif len(ms_str) == 3:
-                    ms = int(ms_str)
-                else:
-                    ms = int(ms_str[:3])
-                timestamp_ms = mins * 60 * 1000 + secs * 1000 + ms
-                text = match.group(4).strip()
-                lines.append((timestamp_ms, text))
-    return lines
+    """Parse LRC file into parallel (timestamps_ms, texts) lists."""
+    timestamps = []
+    texts = []
+    for line in Path(filepath).read_text().split('\n'):  # read_text already normalised newlines
+        if not line.startswith('['):
+            line = line.lstrip()  # tolerate indented lines
+        tag = _parse_lrc_tag(line)
+        if tag:
+            timestamp_ms, close = tag
+            timestamps.append(timestamp_ms)
+            texts.append(line[close + 1:].strip())
+    return timestamps, texts
 
-def find_current_line(lyrics, position_ms):
+def find_current_line(timestamps, position_ms):
     """Find the index of the current lyric line based on position."""
-    current_idx = 0
-    for i, (timestamp, _) in enumerate(lyrics):
-        if timestamp <= position_ms:
-            current_idx = i
-        else:
-            break
-    return current_idx
+    return max(0, bisect.bisect_right(timestamps, position_ms) - 1)
 
-def display_lyrics(lyrics, current_idx, title, artist):
-    """Display lyrics centered in terminal with current line highlighted."""
-    import shutil as sh
+def write_raw(data):
+    """
+    Write bytes straight to the stdout file descriptor, bypassing the
+    TextIOWrapper (encoding, locking, buffering) for the redraw hot path.
+    """
+    sys.stdout.flush()  # keep ordering with anything written via sys.stdout
+    fd = sys.stdout.fileno()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
-    cols, rows = sh.get_terminal_size((80, 24))
+def display_lyrics(texts, current_idx, title, artist, last_frame=None):
+    """
+    Display lyrics centered in terminal with current line highlighted.
+    Returns a frame key; pass it back as last_frame so that moving the
+    highlight by one line only repaints the rows that actually changed.
+    """
+    cols, rows = _term_size
     r, g, b = get_theme_rgb()
 
     col_current = "\033[1m" + ansi_rgb(r, g, b, brightness=0.92)      # bold album color — active line
@@ -533,70 +848,137 @@ def display_lyrics(lyrics, current_idx, title, artist):
     col_header  = ansi_rgb(r, g, b, brightness=0.70, sat_scale=0.80) # album color — title
     reset       = "\033[0m"
 
-    # Clear screen
-    sys.stdout.write("\033[2J\033[H\033[?25l")
-
-    # Header
-    header = f"{title} - {artist}" if artist else title
-    if len(header) > cols - 4:
-        header = header[:cols - 7] + "..."
-    header_col = (cols - len(header)) // 2
-    sys.stdout.write(f"\033[1;{header_col}H{col_header}{header}{reset}")
-
     available_rows = rows - 4
     lines_before = available_rows // 2
     lines_after  = available_rows - lines_before - 1
 
     start_idx = max(0, current_idx - lines_before)
-    end_idx   = min(len(lyrics), current_idx + lines_after + 1)
+    end_idx   = min(len(texts), current_idx + lines_after + 1)
+
+    frame = (cols, rows, (r, g, b), title, artist, start_idx, end_idx, current_idx)
 
-    for i, idx in enumerate(range(start_idx, end_idx)):
-        _, text = lyrics[idx]
-        row = 3 + i
+    def lyric_row(idx):
+        text = texts[idx]
+        row = 3 + idx - start_idx
         if len(text) > cols - 4:
             text = text[:cols - 7] + "..."
         col = (cols - len(text)) // 2
-        sys.stdout.write(f"\033[{row};{col}H")
         if idx == current_idx:
-            sys.stdout.write(f"{col_current}{text}{reset}")
+            style = col_current
         elif idx < current_idx:
-            sys.stdout.write(f"{col_past}{text}{reset}")
+            style = col_past
         else:
-            sys.stdout.write(f"{col_future}{text}{reset}")
+            style = col_future
+        return f"\033[{row};{col}H{style}{text}{reset}"
 
-    sys.stdout.flush()
+    out = None
+    if last_frame and last_frame[:5] == frame[:5] and abs(current_idx - last_frame[7]) == 1:
+        last_start, last_end, last_idx = last_frame[5:]
+        if start_idx == last_start:
+            out = []
+        elif start_idx == last_start + 1 and current_idx == last_idx + 1 and available_rows > 1:
+            # Window moved down one line: scroll the lyrics region up first
+            # (set margins, index at the bottom margin, reset margins)
+            bottom = 2 + available_rows
+            out = [f"\033[3;{bottom}r\033[{bottom};1H\033D\033[r"]
+        if out is not None:
+            # Restyle the old and new current lines, fill in lines entering
+            # at the bottom and blank the rows of lines that left it
+            if start_idx <= last_idx < end_idx:
+                out.append(lyric_row(last_idx))
+            out.append(lyric_row(current_idx))
+            out.extend(lyric_row(idx) for idx in range(max(last_end, start_idx), end_idx))
+            out.extend(f"\033[{3 + idx - start_idx};1H\033[2K" for idx in range(end_idx, last_end))
+
+    if out is None:
+        # Full redraw: clear screen; the whole frame is collected and written once
+        out = ["\033[2J\033[H\033[?25l"]
+
+        # Header
+        header = f"{title} - {artist}" if artist else title
+        if len(header) > cols - 4:
+            header = header[:cols - 7] + "..."
+        header_col = (cols - len(header)) // 2
+        out.append(f"\033[1;{header_col}H{col_header}{header}{reset}")
+
+        for idx in range(start_idx, end_idx):
+            out.append(lyric_row(idx))
+
+    write_raw("".join(out).encode())
+    return frame
 
 def run_lyrics_display(lyrics_file, title, artist):
     """
     Run the custom lyrics display, syncing with playerctl position.
     Returns when song changes or playback stops.
     """
-    lyrics = parse_lyrics_file(lyrics_file)
-    if not lyrics:
+    timestamps, texts = parse_lyrics_file(lyrics_file)
+    if not timestamps:
         return "no_lyrics"
     
     last_idx = -1
+    last_frame = None
+    last_title_check = time.time()
     
-    while True:
-        # Check if song changed
-        metadata = get_metadata()
-        if not metadata or metadata['title'] != title:
-            return "song_changed"
-        
-        # Get current position
-        position = get_position()
-        if position is None:
-            return "no_position"
-        
-        # Find current line
-        current_idx = find_current_line(lyrics, position)
-        
-        # Only redraw if line changed
-        if current_idx != last_idx:
-            display_lyrics(lyrics, current_idx, title, artist)
-            last_idx = current_idx
-        
-        time.sleep(0.1)  # 100ms refresh rate
+    # Wake on track changes pushed by DBus signals (or by playerctl when
+    # signals are unavailable) instead of polling metadata
+    follower = None
+    selector = selectors.DefaultSelector()
+    if not _player_watch_active:
+        follower = follow_title()
+        selector.register(follower.stdout, selectors.EVENT_READ)
+    pending = b""
+    
+    try:
+        while True:
+            # Get current position
+            position = get_position()
+            if position is None:
+                return "no_position"
+            
+            # Find current line
+            current_idx = find_current_line(timestamps, position)
+            
+            # Only redraw if line changed
+            if current_idx != last_idx:
+                last_frame = display_lyrics(texts, current_idx, title, artist, last_frame)
+                last_idx = current_idx
+            
+            # Sleep until the next line is due (capped so seeks are noticed)
+            timeout = 1.0
+            if current_idx + 1 < len(timestamps):
+                next_ts = timestamps[current_idx + 1]
+                timeout = min(1.0, max(0.01, (next_ts - position) / 1000))
+            
+            if follower is None:
+                # Check if song changed, on a signal or every few seconds
+                # in case a signal was missed
+                changed = wait_for_player_change(timeout)
+                if changed or time.time() - last_title_check > TITLE_CHECK_INTERVAL:
+                    last_title_check = time.time()
+                    metadata = get_metadata()
+                    if not metadata or metadata['title'] != title:
+                        return "song_changed"
+                continue
+            
+            if not selector.select(timeout):
+                continue
+            
+            # Check if song changed
+            data = os.read(follower.stdout.fileno(), 4096)
+            if not data:
+                return "song_changed"  # playerctl exited; let main re-check
+            *changes, pending = (pending + data).split(b"\n")
+            if any(line.decode(errors="replace").strip() != title for line in changes):
+                return "song_changed"
+    finally:
+        selector.close()
+        if follower is not None:
+            follower.terminate()
+            try:
+                follower.wait(timeout=1)
+            except Exception:
+                follower.kill()
 
 def process_song(metadata, is_slowed=False):
     """
@@ -608,6 +990,13 @@ def process_song(metadata, is_slowed=False):
     raw_title = metadata['title']
     current_duration = metadata['length_sec']
     metadata_artist = metadata.get('artist', '').strip() or None
+    
+    # Skip the search entirely for songs that recently had no lyrics
+    negative = load_negative_cache()
+    if time.time() - negative.get(raw_title, 0) < NEGATIVE_CACHE_TTL:
+        log("⏭️  No lyrics found for this song recently, skipping search")
+        return False
+    
     part1, part2 = parse_title(raw_title)
     
     # Build search attempts - order depends on song type
@@ -658,17 +1047,39 @@ def process_song(metadata, is_slowed=False):
             unique_attempts.append(attempt)
     attempts = unique_attempts
     
+    # Fire all attempts concurrently, but honour their preference order:
+    # results are collected in submission order and the first hit wins
     lyrics_data = None
+    network_error = False
+    expected_duration = current_duration if is_slowed else None
+    slots = threading.Semaphore(4)
+    cancelled = threading.Event()
+    outcomes = []
     for song, artist in attempts:
         log(f"🔍 Trying: Song='{song}', Artist='{artist or 'Unknown'}'")
-        lyrics_data = fetch_lyrics_lrclib(song, artist, expected_duration=current_duration if is_slowed else None)
-        if lyrics_data:
-            break
+        outcomes.append(lookup_in_background(song, artist, expected_duration, slots, cancelled))
+    try:
+        for outcome in outcomes:
+            ok, lyrics_data = outcome.get()
+            if not ok:
+                network_error = True
+                continue
+            if lyrics_data:
+                break
+    finally:
+        cancelled.set()
     
     if not lyrics_data:
         log("❌ Could not find matching lyrics")
+        # Only remember a definite miss, not one caused by network errors
+        if not network_error:
+            negative[raw_title] = time.time()
+            save_negative_cache(negative)
         return False
     
+    if negative.pop(raw_title, None) is not None:
+        save_negative_cache(negative)
+    
     log(f"✅ Found: '{lyrics_data['title']}' by '{lyrics_data['artist']}'")
     
     original_duration = lyrics_data.get('duration')
@@ -695,13 +1106,20 @@ def process_song(metadata, is_slowed=False):
     return True
 
 def main():
-    global original_config_backed_up, fallback_mode
+    global original_config_backed_up, fallback_mode, _player_watch_active
     
     # Clear old log on startup
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     if LOG_FILE.exists():
         LOG_FILE.unlink()
     log("sptlrx-scaled started")
+    prune_negative_cache()
+    prune_api_cache()
+    
+    # Get pushed player changes over DBus when available
+    _player_watch_active = start_player_watch()
+    if _player_watch_active:
+        log("Listening for MPRIS PropertiesChanged signals")
     
     # Hide cursor
     sys.stdout.write("\033[?25l")
@@ -718,7 +1136,7 @@ def main():
                 fallback_mode = True
                 last_title = None
                 show_music_icon("No music playing")
-                time.sleep(1)
+                wait_for_player_change(1)
                 continue
             
             current_title = metadata['title']
@@ -729,7 +1147,7 @@ def main():
                 fallback_mode = True
                 last_title = None
                 show_music_icon("Waiting for song info...")
-                time.sleep(1)
+                wait_for_player_change(1)
                 continue
             
             # Check if song changed
@@ -761,7 +1179,7 @@ def main():
                     elif result == "no_position":
                         show_music_icon("Playback stopped")
                         last_title = None
-                        time.sleep(1)
+                        wait_for_player_change(1)
                 else:
                     # No lyrics found - show cmatrix in album art color
                     log("No lyrics - starting cmatrix fallback")
@@ -778,7 +1196,7 @@ def main():
             # If lyrics not found, we showed nms once.
             # Now we just wait for song change.
             
-            time.sleep(0.1)
+            wait_for_player_change(player_poll_interval())
             
     except KeyboardInterrupt:
         pass